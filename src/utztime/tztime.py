@@ -13,8 +13,55 @@ from . import utimezone
 _isupy = True if sys.implementation.name == "micropython" else False
 _EPOCH_YEAR = time.gmtime(0)[0]
 
+# upy has no timezone support, so localtime is always gmtime.  On unix python, this is only
+# true when the system timezone is UTC with no DST.
+_localIsUTC = True if _isupy or (time.timezone == 0 and time.daylight == 0) else False
 
-def _mktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> int:
+
+# The current time, in whole seconds. time() is already an int on upy, unix python can skip the float round trip.
+if _isupy:
+    def _now() -> int:
+        return int(time.time())
+else:
+    def _now() -> int:
+        return time.time_ns() // 1000000000
+
+
+def _daysFromCivil(year: int, month: int, day: int) -> int:
+    """
+    Reference: https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+
+    Don't use this directly. Provided for use within this class.
+    The number of days from Jan 1 1970 to the given date. month 1-12, day 1-31
+    """
+    if month <= 2:
+        year -= 1
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+# Days from Jan 1 1970, to the platforms EPOCH
+_EPOCH_DAYS = _daysFromCivil(_EPOCH_YEAR, 1, 1)
+
+
+# The mktime() used by _mktime(), chosen once here rather than on each call.
+# When the system localtime is UTC (always on upy), this is pure integer math, the inverse of gmtime().
+# Otherwise it has to be the libc mktime(), to match the localtime() used by _gmtime().
+if _localIsUTC:
+    def _rawMktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> int:
+        year += (month - 1) // 12
+        month = (month - 1) % 12 + 1
+        days = _daysFromCivil(year, month, 1) - _EPOCH_DAYS + day - 1
+        return days * 86400 + hour * 3600 + min * 60 + sec
+else:
+    def _rawMktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> int:
+        return int(time.mktime((year, month, day, hour, min, sec, -1, -1, -1)))
+
+
+def _clampedMktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> int:
     """
     Reference: https://www.geeksforgeeks.org/python-time-mktime-method/
 
@@ -22,6 +69,7 @@ def _mktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> i
     A platform safe mktime, since unix and upython have slightly different versions
     upython the tuple is (y,m,d,h,m,s,wk,yd)
     Unix python the tuple is (y,m,d,h,m,s,wk,yd,dst)
+    Out of range values roll over into the next/previous field, the same as mktime().
     0: year: 2000-2060+-?
     1: month: 1-12
     2: day: 1-31
@@ -30,12 +78,145 @@ def _mktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> i
     5: sec: 0-61
     6: dow: 0-6. Monday == 0
     7: yd: 1-366
+    Never returns a time before the EPOCH.
+    """
+    if year < _EPOCH_YEAR:
+        year = _EPOCH_YEAR
+    t = _rawMktime(year, month, day, hour, min, sec)
+    return t if t > 0 else 0
+
+
+# _mktime() results are memoized, the same values tend to recur (rule change overs, rounding to midnight...).
+# unix python uses functools.lru_cache. upy has no functools built in, so a small dict is cleared when full.
+_MKTIME_CACHE_SIZE = 64 if _isupy else 1024
+
+if _isupy:
+    _MKTIME_CACHE: dict = {}
+
+    def _mktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> int:
+        """
+        Don't use this directly. Provided for use within this class.
+        Memoized _clampedMktime()
+        """
+        key = (year, month, day, hour, min, sec)
+        t = _MKTIME_CACHE.get(key)
+        if t is None:
+            if len(_MKTIME_CACHE) >= _MKTIME_CACHE_SIZE:
+                _MKTIME_CACHE.clear()
+            t = _clampedMktime(year, month, day, hour, min, sec)
+            _MKTIME_CACHE[key] = t
+        return t
+else:
+    import functools
+
+    @functools.lru_cache(maxsize=_MKTIME_CACHE_SIZE)
+    def _mktime(year: int, month: int, day: int, hour: int, min: int, sec: int) -> int:
+        """
+        Don't use this directly. Provided for use within this class.
+        Memoized _clampedMktime()
+        """
+        return _clampedMktime(year, month, day, hour, min, sec)
+
+
+def _structTime(t: int) -> tuple:
+    """
+    Don't use this directly. Provided for use within this class.
+    The structured time tuple of the time value t. The only place these are calculated.
+    """
+    return time.localtime(t)
+
+
+def _clockStime(gm: tuple, hour: int, min: int, sec: int) -> tuple | None:
+    """
+    Don't use this directly. Provided for use within this class.
+    Build the structured time for a new hour/min/sec on the same day as gm.
+    When the new values don't roll over into another day, the date, dow and yd
+    values of gm are still correct, and the new instance can skip its own localtime() call.
+    Returns None when the values roll over, gm is before the EPOCH (_mktime clamps those),
+    or the system localtime isn't UTC (DST gaps).
+    """
+    if _localIsUTC and gm[0] >= _EPOCH_YEAR and 0 <= hour < 24 and 0 <= min < 60 and 0 <= sec < 60:
+        return (gm[0], gm[1], gm[2], hour, min, sec) + tuple(gm[6:])
+    return None
+
+
+# Zero padded 2 digit strings of 0-99, used to build the ISO8601 strings without any format parsing
+_D2 = ["%02d" % i for i in range(100)]
+
+# The formatted ISO8601 Zone designator of each UTC offset (in minutes) used so far
+_ISO_ZONES: dict = {}
+
+
+# Days in each month, Jan - Dec, of a non leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _daysInMonth(year: int, month: int) -> int:
+    """
+    Don't use this directly. Provided for use within this class.
+    The number of days in the month (1-12) of the given year.
+    """
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _readDigits(s: str, i: int, n: int) -> int:
+    """
+    Don't use this directly. Provided for use within this class.
+    Read the n ascii digits of s starting at index i, as an int.
+    """
+    v = 0
+    for c in s[i:i + n]:
+        d = ord(c) - 0x30
+        if d < 0 or d > 9:
+            raise ValueError(f"Invalid ISO8601 time [{s}]")
+        v = v * 10 + d
+    return v
+
+
+def _isoZone(offset: int) -> str:
+    """
+    Don't use this directly. Provided for use within this class.
+    The ISO8601 Zone designator for the UTC offset, in minutes. eg. -09:00
+    Each offset is only formatted once, there are only a few dozen in real use.
+    """
+    zone = _ISO_ZONES.get(offset)
+    if zone is None:
+        offsetHours, offsetMinutes = divmod(abs(offset), 60)
+        zone = ("-" if offset < 0 else "+") + _D2[offsetHours] + ":" + _D2[offsetMinutes]
+        _ISO_ZONES[offset] = zone
+    return zone
+
+
+def _formatISO8601(gm: tuple, offset: int | None) -> str:
+    """
+    Don't use this directly. Provided for use within this class.
+    Format the structured time gm as an ISO8601 string, with the UTC offset, in minutes, as the
+    Zone designator.  None for Zulu.
+    """
+    year = gm[0]
+    # The table only covers 4 digit years.  Larger years are valid on unix python
+    yearStr = _D2[year // 100] + _D2[year % 100] if 0 <= year <= 9999 else "%04d" % year
+    return "".join((yearStr, "-", _D2[gm[1]], "-", _D2[gm[2]],
+                    "T", _D2[gm[3]], ":", _D2[gm[4]], ":", _D2[gm[5]],
+                    "Z" if offset is None else _isoZone(offset)))
+
+
+def toISO8601List(times: list, tz: utimezone.Timezone | None = None) -> list:
+    """
+    Generate the ISO8601 formatted strings for a list of raw time values, all within the same tz.
+    The same as calling TZTime(t, tz).toISO8601() for each value, without creating a TZTime for each.
+    Use the tz as the Zone designator.  None for Zulu or Local.
     """
-    year = max(year, _EPOCH_YEAR)
-    if _isupy:
-        return max(0, int(time.mktime((year, month, day, hour, min, sec, None, None))))  # type: ignore [arg-type]
-    else:
-        return max(0, int(time.mktime((year, month, day, hour, min, sec, -1, -1, -1))))
+    isos = []
+    for t in times:
+        gm = _structTime(t)
+        if tz is None:
+            isos.append(_formatISO8601(gm, None))
+        else:
+            isos.append(_formatISO8601(gm, tz._dst.offset if tz.locIsDST(t) else tz._std.offset))
+    return isos
 
 
 class TZTime:
@@ -48,29 +229,38 @@ class TZTime:
     use this class is to in fact have your system clock set to UTC time.
     """
 
-    def __init__(self, t: int | None = None, tz: utimezone.Timezone | None = None):
+    # Lots of these get created when daisy chaining, keep them small.
+    __slots__ = ('_time', '_stime', '_tz', '_utc', '_isDST')
+
+    def __init__(self, t: int | None = None, tz: utimezone.Timezone | None = None, _stime: tuple | None = None):
         """
         Create a new instance of a TZTime object.
         Defaults to now() at Zulu if no args are provided.
-        time.time() is used when no t value is provided.
+        _now() is used when no t value is provided. time.time_ns() on unix python, time.time() on upy.
         your system must produce UTC time for this default to be
         effective.
         Use the class TZTime.create() method to create a specific time value.
+        _stime is for internal use only. The already known structured time of t.
         """
 
         # The unix "time" instance
         if t is None:
-            self._time: int = int(time.time())
+            self._time: int = _now()
         else:
-            assert isinstance(t, int), f"t must be an int, received [{t.__class__}]"
             self._time = t
 
         # The structured time. Calculated only the 1st time it's needed
-        self._stime: time.struct_time | None = None
+        self._stime: tuple | None = _stime
 
         # The TimeZone
         self._tz = tz
 
+        # The UTC time value. Calculated only the 1st time it's needed
+        self._utc: int | None = None
+
+        # If this is a DST time. Calculated only the 1st time it's needed
+        self._isDST: bool | None = None
+
 
     @staticmethod
     def now() -> 'TZTime':
@@ -100,14 +290,71 @@ class TZTime:
         return TZTime(t, tz)
 
 
+    @staticmethod
+    def fromISO8601(iso: str) -> 'TZTime':
+        """
+        Create a new instance from an ISO8601 string, in the same format created by toISO8601().
+
+        eg. 2022-01-07T05:00:00-09:00
+
+        Years above 9999 (unix python only) can have more than 4 digits, eg. 10000-01-01T00:00:00Z
+
+        The Zone designator is optional, and can be Z, or a +/-HH:MM offset. No designator is treated like Zulu/UTC.
+        An offset alone can't identify a Timezone, so the returned instance is always converted to UTC.
+        Raises a ValueError if the string is not in this format, any value is out of range, or the time is before the EPOCH.
+        """
+        # The year is at least 4 digits, more for years above 9999. Every other field is fixed width after it.
+        y = iso.find("-")
+        n = len(iso) - y
+        if y < 4 or (n != 15 and n != 16 and n != 21) or \
+                iso[y + 3] != "-" or iso[y + 6] not in "Tt " or iso[y + 9] != ":" or iso[y + 12] != ":":
+            raise ValueError(f"Invalid ISO8601 time [{iso}]")
+
+        year = _readDigits(iso, 0, y)
+        month = _readDigits(iso, y + 1, 2)
+        day = _readDigits(iso, y + 4, 2)
+        hour = _readDigits(iso, y + 7, 2)
+        min = _readDigits(iso, y + 10, 2)
+        sec = _readDigits(iso, y + 13, 2)
+        # sec can be 60 for a leap second
+        if month < 1 or month > 12 or day < 1 or day > _daysInMonth(year, month) or hour > 23 or min > 59 or sec > 60:
+            raise ValueError(f"Invalid ISO8601 time [{iso}]")
+
+        # Not the EPOCH clamped _mktime(), the offset can still move a time before the EPOCH year after it.
+        try:
+            t = _rawMktime(year, month, day, hour, min, sec)
+        except OverflowError:
+            raise ValueError(f"Invalid ISO8601 time [{iso}]")
+
+        z = y + 15
+        if n == 16:
+            if iso[z] not in "Zz":
+                raise ValueError(f"Invalid ISO8601 time [{iso}]")
+        elif n == 21:
+            if iso[z] not in "+-" or iso[z + 3] != ":":
+                raise ValueError(f"Invalid ISO8601 time [{iso}]")
+            offsetHours = _readDigits(iso, z + 1, 2)
+            offsetMinutes = _readDigits(iso, z + 4, 2)
+            if offsetHours > 23 or offsetMinutes > 59:
+                raise ValueError(f"Invalid ISO8601 time [{iso}]")
+            offset = offsetHours * 60 + offsetMinutes
+            if iso[z] == "-":
+                offset = -offset
+            t -= offset * utimezone.SECS_PER_MIN
+
+        if t < 0:
+            raise ValueError(f"Unfortunately, upy has a Jan 1 {_EPOCH_YEAR} Epoch limitation.  Can not parse a time before it [{iso}]")
+
+        return TZTime(t, None)
+
+
     def isDST(self) -> bool:
         """
         Return if this time, and the given timezone, is a DST time or not.
         """
-        if self._tz is None:
-            return False
-        else:
-            return self._tz.locIsDST(self._time)
+        if self._isDST is None:
+            self._isDST = False if self._tz is None else self._tz.locIsDST(self._time)
+        return self._isDST
 
 
     def isSTD(self) -> bool:
@@ -137,7 +384,17 @@ class TZTime:
         """
         if not isinstance(other, TZTime):
             return False
-        return self.toUTC()._time == other.toUTC()._time
+        if self._tz is other._tz:
+            return self._time == other._time
+        return self._utcTime() == other._utcTime()
+
+    def __hash__(self) -> int:
+        """
+        Hash of the UTC time value, consistent with the [==] Operator.
+        Allows use in sets, and as dict keys.
+        """
+        return hash(self._utcTime())
+
 
     def __ne__(self, other) -> bool:
         """
@@ -145,7 +402,9 @@ class TZTime:
         """
         if not isinstance(other, TZTime):
             return False
-        return self.toUTC()._time != other.toUTC()._time
+        if self._tz is other._tz:
+            return self._time != other._time
+        return self._utcTime() != other._utcTime()
 
 
     def __gt__(self, other) -> bool:
@@ -154,7 +413,9 @@ class TZTime:
         """
         if not isinstance(other, TZTime):
             return False
-        return self.toUTC()._time > other.toUTC()._time
+        if self._tz is other._tz:
+            return self._time > other._time
+        return self._utcTime() > other._utcTime()
 
 
     def __lt__(self, other) -> bool:
@@ -163,7 +424,9 @@ class TZTime:
         """
         if not isinstance(other, TZTime):
             return False
-        return self.toUTC()._time < other.toUTC()._time
+        if self._tz is other._tz:
+            return self._time < other._time
+        return self._utcTime() < other._utcTime()
 
     def __ge__(self, other) -> bool:
         """
@@ -171,7 +434,9 @@ class TZTime:
         """
         if not isinstance(other, TZTime):
             return False
-        return self.toUTC()._time >= other.toUTC()._time
+        if self._tz is other._tz:
+            return self._time >= other._time
+        return self._utcTime() >= other._utcTime()
 
 
     def __le__(self, other) -> bool:
@@ -180,7 +445,20 @@ class TZTime:
         """
         if not isinstance(other, TZTime):
             return False
-        return self.toUTC()._time <= other.toUTC()._time
+        if self._tz is other._tz:
+            return self._time <= other._time
+        return self._utcTime() <= other._utcTime()
+
+
+    def _utcTime(self) -> int:
+        """
+        Return the UTC time value of this time.
+        Used by the comparison operators, so they don't need to create a new UTC instance each time.
+        The operators compare the raw time values directly when both share the same tz instance.
+        """
+        if self._utc is None:
+            self._utc = self._tz.toUTC(self._time) if self._tz else self._time
+        return self._utc
 
 
     def _gmtime(self) -> tuple:
@@ -188,9 +466,10 @@ class TZTime:
         Return the the underlying structured time tuple.
         We fetch the localtime, because on micropython, this is always the same as gmtime due to the lack of tz capacity.
         On unix python, gmtime converts for us, and we dont' want that.  So, localtime it is.
+        See _structTime()
         """
         if self._stime is None:
-            self._stime = time.localtime(self._time)
+            self._stime = _structTime(self._time)
         return self._stime
 
 
@@ -200,27 +479,23 @@ class TZTime:
         Use the tz as the Zone designator.  None for Zulu or Local.
         The tz does not convert the time, it adds the correct offset value
         used at the end.
+        The year is zero padded to 4 digits. Years above 9999 (unix python only) use as many digits as needed.
         """
 
-        tz = self.tz()
-        if tz is not None:
-            offset = 0
-            if tz.locIsDST(self._time):
-                offset = tz._dst.offset
-            else:
-                offset = tz._std.offset
+        tz = self._tz
+        if tz is None:
+            return _formatISO8601(self._gmtime(), None)
+        offset = tz._dst.offset if self.isDST() else tz._std.offset
+        return _formatISO8601(self._gmtime(), offset)
 
-            offsetHours = int(offset / 60)
-            offsetMinutes = int(offset % 60)
-            offsetDir = "+" if offsetHours > 0 else "-"
-            offsetHours = abs(offsetHours)
-            tzstr = f"{offsetDir}{offsetHours:02d}:{offsetMinutes:02d}"
-        else:
-            tzstr = "Z"
 
-        iso = f"{self.year():04d}-{self.month():02d}-{self.day():02d}T{self.hour():02d}:{self.minute():02d}:{self.second():02d}{tzstr}"
-        return iso
 
+    def components(self) -> tuple:
+        """
+        Get all the values in one call, instead of calling each getter.
+        (year, month, day, hour, minute, second, dayOfWeek)
+        """
+        return self._gmtime()[:7]
 
 
     def year(self) -> int:
@@ -292,139 +567,134 @@ class TZTime:
         If the new TZ is None, this is converted to UTC.
         This will alter the time to the new TimeZone.
         """
-        z = self.toUTC()
         if tz:
-            t = tz.toLocal(z._time)
-            return TZTime(t, tz)
+            return TZTime(tz.toLocal(self._utcTime()), tz)
         else:
-            return z
+            return self.toUTC()
 
 
     def toUTC(self) -> 'TZTime':
         """
         convert this time to UTC
         """
-        t = self._time
         if self._tz:
-            t = self._tz.toUTC(t)
-        return TZTime(t, None)
+            return TZTime(self._utcTime(), None)
+        return TZTime(self._time, None, self._stime)
 
 
     def secondsBetween(self, other: 'TZTime') -> int:
         """
         return the number of seconds between this, and the other time
         """
-        thisZ = self.toUTC()
-        otherZ = other.toUTC()
-        return otherZ._time - thisZ._time
+        return other._utcTime() - self._utcTime()
+
+
+    def _replace(self,
+                 year: int | None = None,
+                 month: int | None = None,
+                 day: int | None = None,
+                 hour: int | None = None,
+                 min: int | None = None,
+                 sec: int | None = None) -> 'TZTime':
+        """
+        Don't use this directly. Provided for use by the plus and with methods.
+        Create a new instance in the same timezone, replacing only the given values.
+        The replaced values are normalized by _mktime, so they can be out of range.
+        """
+        gm = self._gmtime()
+        year = gm[0] if year is None else year
+        month = gm[1] if month is None else month
+        day = gm[2] if day is None else day
+        hour = gm[3] if hour is None else hour
+        min = gm[4] if min is None else min
+        sec = gm[5] if sec is None else sec
+        nt = _mktime(year, month, day, hour, min, sec)
+        stime = _clockStime(gm, hour, min, sec) if year == gm[0] and month == gm[1] and day == gm[2] else None
+        return TZTime(nt, self._tz, stime)
 
 
     def plusYears(self, years: int) -> 'TZTime':
         """
         Add x years to a time value.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0] + years, gm[1], gm[2], gm[3], gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(year=self._gmtime()[0] + years)
 
 
     def plusMonths(self, months: int) -> 'TZTime':
         """
         Add x months to a time value.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1] + months, gm[2], gm[3], gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(month=self._gmtime()[1] + months)
 
 
     def plusDays(self, days: int) -> 'TZTime':
         """
         Add x days to a time value.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2] + days, gm[3], gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(day=self._gmtime()[2] + days)
 
 
     def plusHours(self, hours: int) -> 'TZTime':
         """
         Add x hours to a time value.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2], gm[3] + hours, gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(hour=self._gmtime()[3] + hours)
 
 
     def plusMinutes(self, minutes: int) -> 'TZTime':
         """
         Add x minutes to a time value.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2], gm[3], gm[4] + minutes, gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(min=self._gmtime()[4] + minutes)
 
 
     def plusSeconds(self, seconds: int) -> 'TZTime':
         """
         Add x seconds to a time value.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2], gm[3], gm[4], gm[5] + seconds)
-        return TZTime(nt, self._tz)
+        return self._replace(sec=self._gmtime()[5] + seconds)
 
 
     def withYear(self, year: int) -> 'TZTime':
         """
         Set the year value
         """
-        gm = self._gmtime()
-        nt = _mktime(year, gm[1], gm[2], gm[3], gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(year=year)
 
 
     def withMonth(self, month: int) -> 'TZTime':
         """
         Set the month value, can be more than 12, and less than 0, will adjust the year
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], month, gm[2], gm[3], gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(month=month)
 
 
     def withDay(self, day: int) -> 'TZTime':
         """
         Set the Day value. Can be more than 31, and less than 0, will adjust the months.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], day, gm[3], gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(day=day)
 
 
     def withHour(self, hour: int) -> 'TZTime':
         """
         Set the hours value.  Can be more than 24 and less than 0, will adjust the days.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2], hour, gm[4], gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(hour=hour)
 
 
     def withMinute(self, minute: int) -> 'TZTime':
         """
         Set the minutes value. Can be more than 60 and less than 0, will adjust the hours.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2], gm[3], minute, gm[5])
-        return TZTime(nt, self._tz)
+        return self._replace(min=minute)
 
 
     def withSecond(self, second: int) -> 'TZTime':
         """
         Set the seconds value. Can be more than 60 and less than 0, will adjust the minutes.
         """
-        gm = self._gmtime()
-        nt = _mktime(gm[0], gm[1], gm[2], gm[3], gm[4], second)
-        return TZTime(nt, self._tz)
+        return self._replace(sec=second)
 
 
     def withTimezone(self, tz: utimezone.Timezone) -> 'TZTime':
@@ -432,4 +702,4 @@ class TZTime:
         Sets the timezone, making no changes to the time value.
         You can also clear the timezone to UTC by passing None.
         """
-        return TZTime(self._time, tz)
+        return TZTime(self._time, tz, self._stime)
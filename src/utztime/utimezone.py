@@ -22,39 +22,49 @@ Not Currently Thread Safe. Uses an internal field state tracked by year.  I'll f
 import time
 import utztime.tztime
 
+try:
+    from micropython import const  # type: ignore [import-not-found]
+except ImportError:
+    def const(x):
+        """
+        Stand-in for the upy const() on unix python
+        """
+        return x
+
 # week values for TimeChangeRule
-LAST = -1
-FIRST = 0
-SECOND = 1
-THIRD = 2
-FOURTH = 3
+LAST = const(-1)
+FIRST = const(0)
+SECOND = const(1)
+THIRD = const(2)
+FOURTH = const(3)
 
 # dow values for TimeChangeRule  https://www.geeksforgeeks.org/python-time-mktime-method/
-MON = 0
-TUE = 1
-WED = 2
-THU = 3
-FRI = 4
-SAT = 5
-SUN = 6
+MON = const(0)
+TUE = const(1)
+WED = const(2)
+THU = const(3)
+FRI = const(4)
+SAT = const(5)
+SUN = const(6)
 
 # month values for TimeChangeRule  https://www.geeksforgeeks.org/python-time-mktime-method/
-JAN = 1
-FEB = 2
-MAR = 3
-APR = 4
-MAY = 5
-JUN = 6
-JUL = 7
-AUG = 8
-SEP = 9
-OCT = 10
-NOV = 11
-DEC = 12
-
-SECS_PER_MIN = 60
-SECS_PER_DAY = 24 * 60 * 60
-DAYS_PER_WEEK = 7
+JAN = const(1)
+FEB = const(2)
+MAR = const(3)
+APR = const(4)
+MAY = const(5)
+JUN = const(6)
+JUL = const(7)
+AUG = const(8)
+SEP = const(9)
+OCT = const(10)
+NOV = const(11)
+DEC = const(12)
+
+SECS_PER_MIN = const(60)
+SECS_PER_HOUR = const(60 * 60)
+SECS_PER_DAY = const(24 * 60 * 60)
+DAYS_PER_WEEK = const(7)
 
 # Micropython has a Epoch of 2000, not 1970
 EPOCH_YEAR = time.gmtime(0)[0]
@@ -160,6 +170,8 @@ class Timezone:
         self._stdLoc = 0
         self._dstUTC = 0
         self._stdUTC = 0
+        self._locDSTHour: int | None = None
+        self._locDST = False
 
 
     def clone(self, name: str, shallow: bool = False) -> 'Timezone':
@@ -347,7 +359,13 @@ class Timezone:
         """
         Determine whether the given Local time is within the DST interval
         or the Standard time interval.
+        The answer is remembered for the hour the local time falls in, since the
+        rules only ever change over on the hour.
         """
+        hour = local // SECS_PER_HOUR
+        if hour == self._locDSTHour:
+            return self._locDST
+
         # recalculate the time change points if needed
         year: int = time.gmtime(local)[0]
         dstYear: int = time.gmtime(self._dstLoc)[0]
@@ -355,11 +373,17 @@ class Timezone:
             self._calcTimeChanges(year)
 
         if self._stdUTC == self._dstUTC:       # daylight time not observed in this tz
-            return False
+            isDST = False
         elif self._stdLoc > self._dstLoc:      # northern hemisphere
-            return local >= self._dstLoc and local < self._stdLoc
+            isDST = local >= self._dstLoc and local < self._stdLoc
         else:                                  # southern hemisphere
-            return not (local >= self._stdLoc and local < self._dstLoc)
+            isDST = not (local >= self._stdLoc and local < self._dstLoc)
+
+        # A non-UTC unix system clock can shift the change over points off the hour
+        if self._dstLoc % SECS_PER_HOUR == 0 and self._stdLoc % SECS_PER_HOUR == 0:
+            self._locDSTHour = hour
+            self._locDST = isDST
+        return isDST
 
 
     def locIsSTD(self, loc: int) -> bool:
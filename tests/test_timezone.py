@@ -185,6 +185,23 @@ class test_timezone(unittest.TestCase):
         assert tz.utcIsSTD(EAST_02) is True
 
 
+    def test_is_local_dst_around_change_over(self):
+
+        # Given
+        tz = Timezone(name="MyZone", std=EST, dst=EDT)
+        dstStart = EDT.toTime(2023)
+        stdStart = EST.toTime(2023)
+
+        # Then
+        assert tz.locIsDST(dstStart - 1) is False
+        assert tz.locIsDST(dstStart) is True
+        assert tz.locIsDST(dstStart + 1) is True
+        assert tz.locIsDST(dstStart - 1) is False
+        assert tz.locIsDST(stdStart - 1) is True
+        assert tz.locIsDST(stdStart) is False
+        assert tz.locIsDST(stdStart - 1) is True
+
+
     # def test_std_dst_crossover(self):
 
     #     # Given
@@ -1,5 +1,8 @@
-from utztime import TZTime, EPOCH
+from utztime import TZTime, EPOCH, Timezone, TimeChangeRule
+from utztime.tztime import _rawMktime, _mktime, _MKTIME_CACHE_SIZE, toISO8601List
+import utztime.tztime as tztime
 import unittest
+import sys
 import time
 from utztime.tz.us import America_New_York
 from utztime.tz.us import America_Los_Angeles
@@ -39,6 +42,19 @@ class test_tz_time(unittest.TestCase):
         assert t.tz() is None
 
 
+    def test_components(self):
+
+        # Given
+        t = TZTime.create(2022, 1, 7, 5, 6, 7, America_Anchorage)
+
+        # When
+        c = t.components()
+
+        # Then
+        assert c == (2022, 1, 7, 5, 6, 7, 4)
+        assert c == (t.year(), t.month(), t.day(), t.hour(), t.minute(), t.second(), t.dayOfWeek())
+
+
     def test_create_specific_TZ_time(self):
 
         # When
@@ -64,6 +80,150 @@ class test_tz_time(unittest.TestCase):
         assert t.toISO8601() == "2022-01-07T05:00:00-09:00", t.toISO8601()
 
 
+    def test_toiso_utc(self):
+
+        # When
+        t = TZTime.create(2009, 11, 27, 23, 8, 59)
+
+        # Then
+        assert t.toISO8601() == "2009-11-27T23:08:59Z", t.toISO8601()
+        assert str(t) == "2009-11-27T23:08:59Z"
+
+
+    def test_toiso_five_digit_year(self):
+
+        # upy devices can't create time values this far out
+        if sys.implementation.name == "micropython":
+            return
+
+        # When
+        t = TZTime.create(10000, 1, 1, 0, 0, 0)
+
+        # Then
+        assert t.toISO8601() == "10000-01-01T00:00:00Z", t.toISO8601()
+        assert str(t) == "10000-01-01T00:00:00Z"
+        assert toISO8601List([t.time()]) == ["10000-01-01T00:00:00Z"]
+
+
+    def test_toiso_offset_sign(self):
+
+        # Given
+        def zone(offset: int) -> Timezone:
+            return Timezone("Zone", TimeChangeRule("STD", 0, 0, 1, 2, offset), None)
+
+        # When
+        t = TZTime.create(2022, 1, 7, 5, 0, 0)
+
+        # Then
+        assert t.withTimezone(zone(0)).toISO8601() == "2022-01-07T05:00:00+00:00"
+        assert t.withTimezone(zone(30)).toISO8601() == "2022-01-07T05:00:00+00:30"
+        assert t.withTimezone(zone(-30)).toISO8601() == "2022-01-07T05:00:00-00:30"
+        assert t.withTimezone(zone(345)).toISO8601() == "2022-01-07T05:00:00+05:45"
+        assert t.withTimezone(zone(-210)).toISO8601() == "2022-01-07T05:00:00-03:30"
+
+
+    def test_toiso_list(self):
+
+        # Given
+        times = [TZTime.create(2022, 1, 7, 5, 0, 0).time(), TZTime.create(2022, 7, 7, 5, 0, 0).time()]
+
+        # When
+        utc = toISO8601List(times)
+        ak = toISO8601List(times, America_Anchorage)
+
+        # Then
+        assert utc == ["2022-01-07T05:00:00Z", "2022-07-07T05:00:00Z"], utc
+        assert ak == ["2022-01-07T05:00:00-09:00", "2022-07-07T05:00:00-08:00"], ak
+        assert ak == [TZTime(t, America_Anchorage).toISO8601() for t in times]
+        assert toISO8601List([]) == []
+
+
+    def test_fromiso_utc(self):
+
+        # When
+        t1 = TZTime.fromISO8601("2009-11-27T23:08:59Z")
+        t2 = TZTime.fromISO8601("2009-11-27T23:08:59")
+
+        # Then
+        assert t1 == TZTime.create(2009, 11, 27, 23, 8, 59)
+        assert t1.tz() is None
+        assert t1.toISO8601() == "2009-11-27T23:08:59Z"
+        assert t2 == t1
+        assert TZTime.fromISO8601("2020-02-29T23:59:59Z") == TZTime.create(2020, 2, 29, 23, 59, 59)
+        assert TZTime.fromISO8601("2016-12-31T23:59:60Z") == TZTime.create(2017, 1, 1, 0, 0, 0)
+
+
+    def test_fromiso_with_offset(self):
+
+        # Given
+        t = TZTime.create(2022, 1, 7, 5, 0, 0, America_Anchorage)
+
+        # When
+        t1 = TZTime.fromISO8601(t.toISO8601())
+        t2 = TZTime.fromISO8601("2022-01-07T19:30:00+05:30")
+
+        # Then
+        assert t1 == t
+        assert t1.tz() is None
+        assert t1.toISO8601() == "2022-01-07T14:00:00Z"
+        assert t2 == t
+
+
+    def test_fromiso_invalid(self):
+
+        for iso in ["", "2022-01-07", "2022-01-07T05:00:00+0900", "2022-01-07T05:00:00Q", "2022-01-07T05:0a:00Z", "2022/01/07T05:00:00Z",
+                    "2022-02-29T00:00:00Z", "2020-02-30T00:00:00Z", "2022-04-31T00:00:00Z", "2022-13-01T00:00:00Z", "2022-00-01T00:00:00Z",
+                    "2022-01-00T00:00:00Z", "2022-01-01T24:00:00Z", "2022-01-01T25:61:61Z", "2022-01-01T00:60:00Z", "2022-01-01T00:00:61Z",
+                    "2022-01-01T00:00:00+99:99", "2022-01-01T00:00:00+24:00", "2022-01-01T00:00:00-01:60",
+                    "022-01-01T00:00:00Z", "-2022-01-01T00:00:00Z", "+2022-01-01T00:00:00Z"]:
+
+            # Then
+            with self.assertRaises(ValueError):
+                # When
+                TZTime.fromISO8601(iso)
+
+
+    def test_fromiso_before_epoch(self):
+
+        # Time values only line up with the EPOCH when the system localtime is UTC
+        if not tztime._localIsUTC:
+            return
+
+        # When
+        t1 = TZTime.fromISO8601(f"{EPOCH.year() - 1}-12-31T23:30:00-01:00")
+        t2 = TZTime.fromISO8601(f"{EPOCH.year()}-01-01T00:30:00-01:00")
+
+        # Then
+        assert t1 == TZTime.fromISO8601(f"{EPOCH.year()}-01-01T00:30:00Z")
+        assert t1.time() == 1800
+        assert t2.time() == 5400
+
+        with self.assertRaises(ValueError):
+            TZTime.fromISO8601(f"{EPOCH.year()}-01-01T00:30:00+01:00")
+        with self.assertRaises(ValueError):
+            TZTime.fromISO8601(f"{EPOCH.year() - 1}-12-31T23:30:00Z")
+
+
+    def test_fromiso_five_digit_year(self):
+
+        # upy devices can't create time values this far out
+        if sys.implementation.name == "micropython":
+            return
+
+        # Given
+        t = TZTime.create(10000, 1, 1, 0, 0, 0)
+
+        # When
+        t1 = TZTime.fromISO8601(t.toISO8601())
+        t2 = TZTime.fromISO8601("10000-01-01T01:00:00+01:00")
+
+        # Then
+        assert t1 == t
+        assert t2 == t
+        with self.assertRaises(ValueError):
+            TZTime.fromISO8601("10000-01-01T00:00:0Z")
+
+
     def test_UTC_is_before_EST(self):
 
         # Given
@@ -97,6 +257,23 @@ class test_tz_time(unittest.TestCase):
         assert t2 == t3
 
 
+    def test_time_hash(self):
+
+        # Given
+        t1 = TZTime.create(2001, 2, 3, 4, 5, 6, America_Los_Angeles)
+        t2 = TZTime.create(2001, 2, 3, 4, 5, 6, America_Los_Angeles)
+        t3 = TZTime.create(2001, 2, 3, 7, 5, 6, America_New_York)
+        t4 = TZTime.create(2001, 2, 3, 7, 5, 6)
+
+        # When
+        times = {t1, t2, t3, t4}
+
+        # Then
+        assert hash(t1) == hash(t2) == hash(t3)
+        assert len(times) == 2
+        assert t4 in times
+
+
     def test_time_ne(self):
 
         # Given
@@ -170,6 +347,36 @@ class test_tz_time(unittest.TestCase):
         assert t3 == t3
 
 
+    def test_time_sort(self):
+
+        # Given
+        t1 = TZTime.create(2001, 2, 3, 4, 5, 5, America_Los_Angeles)
+        t2 = TZTime.create(2001, 2, 3, 4, 5, 6)
+        t3 = TZTime.create(2001, 2, 3, 7, 5, 6, America_New_York)
+
+        # When
+        times = sorted([t1, t2, t3, t1])
+
+        # Then
+        assert times == [t2, t1, t1, t3]
+        assert times[0] is t2
+        assert times[3] is t3
+
+
+    def test_seconds_between(self):
+
+        # Given
+        t1 = TZTime.create(2001, 2, 3, 4, 5, 6, America_Los_Angeles)
+        t2 = TZTime.create(2001, 2, 3, 7, 6, 16, America_New_York)
+        t3 = TZTime.create(2001, 2, 3, 12, 5, 6)
+
+        # Then
+        assert t1.secondsBetween(t2) == 70
+        assert t2.secondsBetween(t1) == -70
+        assert t1.secondsBetween(t3) == 0
+        assert t3.secondsBetween(t3.plusHours(2)) == 7200
+
+
     def test_pre_epoch_time(self):
 
         # Then
@@ -620,3 +827,90 @@ class test_tz_time(unittest.TestCase):
         assert t2.minute() == 5
         assert t2.second() == 5
         assert t2.tz() == America_Los_Angeles
+
+
+    def test_clock_chain_matches_localtime(self):
+
+        # Given
+        t1 = TZTime.create(2020, 2, 28, 4, 5, 5, America_Los_Angeles)
+
+        # When
+        t2 = t1.withHour(0).withMinute(0).withSecond(0).plusHours(23).plusMinutes(59).plusSeconds(59)
+        t3 = t2.plusSeconds(1)
+
+        # Then
+        assert t2._gmtime()[:7] == time.localtime(t2.time())[:7]
+        assert t3._gmtime()[:7] == time.localtime(t3.time())[:7]
+        assert t2.day() == 28
+        assert t2.hour() == 23
+        assert t2.minute() == 59
+        assert t2.second() == 59
+        assert t3.month() == 2
+        assert t3.day() == 29
+        assert t3.hour() == 0
+        assert t3.dayOfWeek() == 5
+
+
+    def test_mktime_cache_is_bounded(self):
+
+        # Given
+        t = _mktime(2001, 2, 3, 4, 5, 6)
+
+        # When
+        for sec in range(_MKTIME_CACHE_SIZE * 2):
+            _mktime(2002, 1, 1, 0, 0, sec)
+
+        # Then
+        if hasattr(_mktime, "cache_info"):
+            assert _mktime.cache_info().currsize <= _MKTIME_CACHE_SIZE
+        else:
+            assert len(tztime._MKTIME_CACHE) <= _MKTIME_CACHE_SIZE
+        assert _mktime(2001, 2, 3, 4, 5, 6) == t
+        assert _mktime(2001, 2, 3, 4, 5, 6) == TZTime.create(2001, 2, 3, 4, 5, 6).time()
+
+
+    def test_mktime_threads(self):
+
+        # threading is optional on upy
+        try:
+            import threading
+        except ImportError:
+            return
+
+        # Given
+        errors = []
+
+        def worker(offset: int):
+            try:
+                for sec in range(_MKTIME_CACHE_SIZE * 4):
+                    assert _mktime(2001, 1, 1, 0, offset, sec) == TZTime.create(2001, 1, 1, 0, offset, sec).time()
+            except Exception as e:
+                errors.append(e)
+
+        # When
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert errors == [], errors
+
+
+    def test_raw_mktime_rolls_over(self):
+
+        for values, expected in [((2001, 2, 3, 4, 5, 6), (2001, 2, 3, 4, 5, 6)),
+                                 ((2001, 0, 0, 0, 0, 0), (2000, 11, 30, 0, 0, 0)),
+                                 ((2001, 14, 3, 4, 5, 6), (2002, 2, 3, 4, 5, 6)),
+                                 ((2002, -13, 3, 4, 5, 6), (2000, 11, 3, 4, 5, 6)),
+                                 ((2020, 2, 30, 0, 0, 0), (2020, 3, 1, 0, 0, 0)),
+                                 ((2021, 3, 0, 0, 0, 0), (2021, 2, 28, 0, 0, 0)),
+                                 ((2001, 2, 3, 26, -70, 122), (2001, 2, 4, 0, 52, 2)),
+                                 ((2040, 12, 31, 23, 59, 60), (2041, 1, 1, 0, 0, 0))]:
+
+            # When
+            t = _rawMktime(*values)
+
+            # Then
+            assert tuple(time.localtime(t))[:6] == expected, values